@@ -1,5 +1,8 @@
+import logging
+
 from dotenv import load_dotenv
 from flask import Flask, jsonify, make_response, Response, request
+from flask.logging import default_handler
 # from flask_cors import CORS
 
 from boxing.models import boxers_model
@@ -18,8 +21,14 @@ app = Flask(__name__)
 
 
 ring_model = RingModel()
+
+# Replace Flask's default handler with ours rather than logging every line twice
+app.logger.removeHandler(default_handler)
 configure_logger(app.logger)
 
+# The boxing.* module loggers propagate here, so configure them once
+configure_logger(logging.getLogger("boxing"))
+
 
 ####################################################
 #
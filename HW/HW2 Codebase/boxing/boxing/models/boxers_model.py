@@ -1,17 +1,86 @@
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import sqlite3
-from typing import Any, List
+import threading
+import time
+from typing import Any, Iterable, List, Tuple
 
 from boxing.utils.sql_utils import get_db_connection
-from boxing.utils.logger import configure_logger
 
 
 logger = logging.getLogger(__name__)
-configure_logger(logger)
 
 
-@dataclass
+# Lower weight bound of each weight class, in ascending order
+_WEIGHT_CLASS_THRESHOLDS = (125, 133, 166, 203)
+_WEIGHT_CLASSES = ('FEATHERWEIGHT', 'LIGHTWEIGHT', 'MIDDLEWEIGHT', 'HEAVYWEIGHT')
+
+
+# SQL is kept in module constants so every call reuses the same statement text
+_SQL_INSERT = """
+    INSERT INTO boxers (name, weight, height, reach, age)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_SKIP_EXISTING = """
+    INSERT INTO boxers (name, weight, height, reach, age)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO NOTHING
+"""
+_SQL_DELETE = "DELETE FROM boxers WHERE id = ?"
+_SQL_GET_BY_ID = """
+    SELECT id, name, weight, height, reach, age
+    FROM boxers WHERE id = ?
+"""
+_SQL_GET_BY_NAME = """
+    SELECT id, name, weight, height, reach, age
+    FROM boxers WHERE name = ?
+"""
+_SQL_UPDATE_STATS = "UPDATE boxers SET fights = fights + 1, wins = wins + ? WHERE id = ?"
+
+# Built from the same tables as get_weight_class so the two cannot drift apart;
+# weights below the lightest class fall through to NULL
+_SQL_WEIGHT_CLASS = "CASE " + " ".join(
+    f"WHEN weight >= {threshold} THEN '{weight_class}'"
+    for threshold, weight_class in reversed(list(zip(_WEIGHT_CLASS_THRESHOLDS, _WEIGHT_CLASSES)))
+) + " END"
+
+_SQL_LEADERBOARD_BASE = f"""
+    SELECT id, name, weight, height, reach, age,
+           {_SQL_WEIGHT_CLASS} AS weight_class,
+           fights, wins,
+           (wins * 1.0 / fights) AS win_pct
+    FROM boxers
+    WHERE fights > 0
+"""
+_SQL_LEADERBOARD = {
+    'wins': _SQL_LEADERBOARD_BASE + " ORDER BY wins DESC",
+    'win_pct': _SQL_LEADERBOARD_BASE + " ORDER BY win_pct DESC",
+}
+
+# Leaderboards are read far more often than fights happen, so each sort order
+# is cached as (computed_at, leaderboard) for up to _LEADERBOARD_TTL seconds.
+# Deleting a boxer or recording a result clears the cache and bumps the
+# generation; a query that started before that never stores its stale result.
+# Callers always get their own copy, so editing it cannot change the cache.
+_LEADERBOARD_TTL = 30
+_leaderboard_lock = threading.Lock()
+_leaderboard_cache: dict[str, Tuple[float, List[dict[str, Any]]]] = {}
+_leaderboard_generation = 0
+
+# Boxers looked up by id or name are memoized. Misses raise, so they are never
+# cached. Deleting a boxer clears the cache and bumps the generation; a lookup
+# only stores its result if the generation has not changed since it started,
+# so a lookup racing with a delete cannot re-cache the deleted boxer.
+_BOXER_CACHE_SIZE = 1024
+_boxer_cache_lock = threading.Lock()
+_boxers_by_id: dict[int, "Boxer"] = {}
+_boxers_by_name: dict[str, "Boxer"] = {}
+_boxer_cache_generation = 0
+
+
+@dataclass(frozen=True, slots=True)
 class Boxer:
     id: int
     name: str
@@ -22,11 +91,60 @@ class Boxer:
     weight_class: str = None
 
     def __post_init__(self):
-        self.weight_class = get_weight_class(self.weight)  # Automatically assign weight class
+        # Automatically assign weight class (frozen, so bypass the generated __setattr__)
+        object.__setattr__(self, 'weight_class', _lookup_weight_class(self.weight))
 
 
-def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
+def _get_cached_boxer(cache: dict, key: Any) -> Tuple[Any, int]:
+    with _boxer_cache_lock:
+        return cache.get(key), _boxer_cache_generation
+
+
+def _cache_boxer(boxer: Boxer, generation: int) -> None:
+    with _boxer_cache_lock:
+        if generation != _boxer_cache_generation:
+            return
+
+        if len(_boxers_by_id) >= _BOXER_CACHE_SIZE:
+            _boxers_by_id.clear()
+            _boxers_by_name.clear()
+
+        _boxers_by_id[boxer.id] = boxer
+        _boxers_by_name[boxer.name] = boxer
+
+
+def _invalidate_boxer_cache() -> None:
+    global _boxer_cache_generation
+
+    with _boxer_cache_lock:
+        _boxer_cache_generation += 1
+        _boxers_by_id.clear()
+        _boxers_by_name.clear()
+
+
+def _invalidate_leaderboard_cache() -> None:
+    global _leaderboard_generation
+
+    with _leaderboard_lock:
+        _leaderboard_generation += 1
+        _leaderboard_cache.clear()
+
+
+def _to_leaderboard_entry(row: sqlite3.Row) -> dict[str, Any]:
+    entry = dict(row)
+    if entry['weight_class'] is None:
+        # Below the lightest class: raise the same error get_weight_class always has
+        get_weight_class(entry['weight'])
+
+    entry['win_pct'] = round(entry['win_pct'] * 100, 1)  # Convert to percentage
+    return entry
 
+
+def _copy_leaderboard(leaderboard: List[dict[str, Any]]) -> List[dict[str, Any]]:
+    return [dict(entry) for entry in leaderboard]
+
+
+def _validate_boxer(weight: int, height: int, reach: float, age: int) -> None:
     if weight < 125:
         raise ValueError(f"Invalid weight: {weight}. Must be at least 125.")
     if height <= 0:
@@ -36,21 +154,17 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
     if not (18 <= age <= 40):
         raise ValueError(f"Invalid age: {age}. Must be between 18 and 40.")
 
+
+def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
+
+    _validate_boxer(weight, height, reach, age)
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if the boxer already exists (name must be unique)
-            cursor.execute("SELECT 1 FROM boxers WHERE name = ?", (name,))
-            if cursor.fetchone():
-                raise ValueError(f"Boxer with name '{name}' already exists")
-
-            cursor.execute("""
-                INSERT INTO boxers (name, weight, height, reach, age)
-                VALUES (?, ?, ?, ?, ?)
-            """, (name, weight, height, reach, age))
-
-            conn.commit()
+            # The unique index on name rejects duplicates with an IntegrityError
+            cursor.execute(_SQL_INSERT, (name, weight, height, reach, age))
 
     except sqlite3.IntegrityError:
         raise ValueError(f"Boxer with name '{name}' already exists")
@@ -59,73 +173,95 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
         raise e
 
 
+def create_boxers_bulk(rows: Iterable[Tuple[str, int, int, float, int]]) -> int:
+    """Inserts many boxers in a single transaction, skipping names that already exist.
+
+    Each row is (name, weight, height, reach, age). Every row is validated before
+    anything is written, so one invalid row leaves the table untouched. Only name
+    conflicts are skipped; any other constraint failure rolls back the whole batch.
+
+    Returns:
+        The number of boxers actually inserted.
+
+    """
+    rows = list(rows)
+    for name, weight, height, reach, age in rows:
+        if not name:
+            raise ValueError(f"Invalid name: {name!r}. Must be a non-empty string.")
+        _validate_boxer(weight, height, reach, age)
+
+    if not rows:
+        return 0
+
+    try:
+        with get_db_connection() as conn, conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+
+            cursor.executemany(_SQL_INSERT_SKIP_EXISTING, rows)
+
+            return cursor.rowcount
+
+    except sqlite3.Error as e:
+        raise e
+
+
 def delete_boxer(boxer_id: int) -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
+            cursor.execute(_SQL_DELETE, (boxer_id,))
+            if cursor.rowcount == 0:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            cursor.execute("DELETE FROM boxers WHERE id = ?", (boxer_id,))
-            conn.commit()
+        _invalidate_leaderboard_cache()
+        _invalidate_boxer_cache()
 
     except sqlite3.Error as e:
         raise e
 
 
 def get_leaderboard(sort_by: str = "wins") -> List[dict[str, Any]]:
-    query = """
-        SELECT id, name, weight, height, reach, age, fights, wins,
-               (wins * 1.0 / fights) AS win_pct
-        FROM boxers
-        WHERE fights > 0
-    """
-
-    if sort_by == "win_pct":
-        query += " ORDER BY win_pct DESC"
-    elif sort_by == "wins":
-        query += " ORDER BY wins DESC"
-    else:
+    query = _SQL_LEADERBOARD.get(sort_by)
+    if query is None:
         raise ValueError(f"Invalid sort_by parameter: {sort_by}")
 
+    with _leaderboard_lock:
+        cached = _leaderboard_cache.get(sort_by)
+        generation = _leaderboard_generation
+
+    if cached is not None and time.monotonic() - cached[0] < _LEADERBOARD_TTL:
+        return _copy_leaderboard(cached[1])
+
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(read_only=True) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row  # Rows map column names to values
             cursor.execute(query)
-            rows = cursor.fetchall()
-
-        leaderboard = []
-        for row in rows:
-            boxer = {
-                'id': row[0],
-                'name': row[1],
-                'weight': row[2],
-                'height': row[3],
-                'reach': row[4],
-                'age': row[5],
-                'weight_class': get_weight_class(row[2]),  # Calculate weight class
-                'fights': row[6],
-                'wins': row[7],
-                'win_pct': round(row[8] * 100, 1)  # Convert to percentage
-            }
-            leaderboard.append(boxer)
-
-        return leaderboard
+
+            # Build entries straight off the cursor instead of materializing fetchall() first
+            leaderboard = [_to_leaderboard_entry(row) for row in cursor]
+
+        with _leaderboard_lock:
+            if generation == _leaderboard_generation:
+                _leaderboard_cache[sort_by] = (time.monotonic(), leaderboard)
+
+        return _copy_leaderboard(leaderboard)
 
     except sqlite3.Error as e:
         raise e
 
 
 def get_boxer_by_id(boxer_id: int) -> Boxer:
+    boxer, generation = _get_cached_boxer(_boxers_by_id, boxer_id)
+    if boxer is not None:
+        return boxer
+
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE id = ?
-            """, (boxer_id,))
+            cursor.execute(_SQL_GET_BY_ID, (boxer_id,))
 
             row = cursor.fetchone()
 
@@ -134,6 +270,7 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
                     id=row[0], name=row[1], weight=row[2], height=row[3],
                     reach=row[4], age=row[5]
                 )
+                _cache_boxer(boxer, generation)
                 return boxer
             else:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
@@ -143,13 +280,14 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
 
 
 def get_boxer_by_name(boxer_name: str) -> Boxer:
+    boxer, generation = _get_cached_boxer(_boxers_by_name, boxer_name)
+    if boxer is not None:
+        return boxer
+
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE name = ?
-            """, (boxer_name,))
+            cursor.execute(_SQL_GET_BY_NAME, (boxer_name,))
 
             row = cursor.fetchone()
 
@@ -158,6 +296,7 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
                     id=row[0], name=row[1], weight=row[2], height=row[3],
                     reach=row[4], age=row[5]
                 )
+                _cache_boxer(boxer, generation)
                 return boxer
             else:
                 raise ValueError(f"Boxer '{boxer_name}' not found.")
@@ -166,19 +305,18 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
         raise e
 
 
-def get_weight_class(weight: int) -> str:
-    if weight >= 203:
-        weight_class = 'HEAVYWEIGHT'
-    elif weight >= 166:
-        weight_class = 'MIDDLEWEIGHT'
-    elif weight >= 133:
-        weight_class = 'LIGHTWEIGHT'
-    elif weight >= 125:
-        weight_class = 'FEATHERWEIGHT'
-    else:
+@lru_cache(maxsize=256)
+def _lookup_weight_class(weight: int) -> str:
+    index = bisect_right(_WEIGHT_CLASS_THRESHOLDS, weight) - 1
+    if index < 0:
+        # lru_cache does not cache exceptions, so invalid weights always raise
         raise ValueError(f"Invalid weight: {weight}. Weight must be at least 125.")
 
-    return weight_class
+    return _WEIGHT_CLASSES[index]
+
+
+def get_weight_class(weight: int) -> str:
+    return _lookup_weight_class(weight)
 
 
 def update_boxer_stats(boxer_id: int, result: str) -> None:
@@ -189,16 +327,11 @@ def update_boxer_stats(boxer_id: int, result: str) -> None:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
+            cursor.execute(_SQL_UPDATE_STATS, (1 if result == 'win' else 0, boxer_id))
+            if cursor.rowcount == 0:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            if result == 'win':
-                cursor.execute("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", (boxer_id,))
-            else:  # result == 'loss'
-                cursor.execute("UPDATE boxers SET fights = fights + 1 WHERE id = ?", (boxer_id,))
-
-            conn.commit()
+        _invalidate_leaderboard_cache()
 
     except sqlite3.Error as e:
         raise e
@@ -1,21 +1,27 @@
 import logging
 import math
-from typing import List
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from boxing.models.boxers_model import Boxer, update_boxer_stats
-from boxing.utils.logger import configure_logger
 from boxing.utils.api_utils import get_random
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 logger = logging.getLogger(__name__)
-configure_logger(logger)
 
 
 class RingModel:
     def __init__(self):
         self.ring: List[Boxer] = []
 
-    def fight(self) -> str:
+    def fight(self, rng: Optional[Callable[[], float]] = None,
+              record_result: Optional[Callable[[int, str], None]] = None) -> str:
+        # rng and record_result default to random.org and the database; tests can pass plain callables
+        rng = rng or get_random
+        record_result = record_result or update_boxer_stats
+
         if len(self.ring) < 2:
             raise ValueError("There must be two boxers to start a fight.")
 
@@ -24,12 +30,17 @@ class RingModel:
         skill_1 = self.get_fighting_skill(boxer_1)
         skill_2 = self.get_fighting_skill(boxer_2)
 
-        # Compute the absolute skill difference
-        # And normalize using a logistic function for better probability scaling
-        delta = abs(skill_1 - skill_2)
-        normalized_delta = 1 / (1 + math.e ** (-delta))
+        # Compute the signed skill difference
+        # And normalize using a logistic function into boxer_1's chance of winning
+        delta = skill_1 - skill_2
+        if delta >= 0:
+            normalized_delta = 1.0 / (1.0 + math.exp(-delta))
+        else:
+            # Same logistic, rearranged so math.exp cannot overflow on large gaps
+            exp_delta = math.exp(delta)
+            normalized_delta = exp_delta / (1.0 + exp_delta)
 
-        random_number = get_random()
+        random_number = rng()
 
         if random_number < normalized_delta:
             winner = boxer_1
@@ -38,8 +49,8 @@ class RingModel:
             winner = boxer_2
             loser = boxer_1
 
-        update_boxer_stats(winner.id, 'win')
-        update_boxer_stats(loser.id, 'loss')
+        record_result(winner.id, 'win')
+        record_result(loser.id, 'loss')
 
         self.clear_ring()
 
@@ -73,3 +84,25 @@ class RingModel:
         skill = (boxer.weight * len(boxer.name)) + (boxer.reach / 10) + age_modifier
 
         return skill
+
+
+def fighting_skill_batch(boxers: List[Boxer]) -> "np.ndarray":
+    """Computes the fighting skill of many boxers at once.
+
+    Same formula as RingModel.get_fighting_skill, evaluated over arrays so
+    that simulating many fights does not pay per-boxer Python overhead.
+    Use the scalar version for a single fight.
+
+    """
+    # Imported here so the app and a single fight never pay for loading numpy
+    import numpy as np
+
+    count = len(boxers)
+    weight = np.fromiter((boxer.weight for boxer in boxers), dtype=float, count=count)
+    name_len = np.fromiter((len(boxer.name) for boxer in boxers), dtype=float, count=count)
+    reach = np.fromiter((boxer.reach for boxer in boxers), dtype=float, count=count)
+    age = np.fromiter((boxer.age for boxer in boxers), dtype=int, count=count)
+
+    age_modifier = np.where(age < 25, -1, np.where(age > 35, -2, 0))
+
+    return weight * name_len + reach / 10 + age_modifier
@@ -1,36 +1,90 @@
+from collections import deque
 import logging
 import os
-import requests
+import random
+import threading
+import time
+from typing import List
 
-from boxing.utils.logger import configure_logger
+import requests
 
 
 logger = logging.getLogger(__name__)
-configure_logger(logger)
 
 
 RANDOM_ORG_URL = os.getenv("RANDOM_ORG_URL",
-                           "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new")
+                           "https://www.random.org/decimal-fractions/?num=128&dec=2&col=1&format=plain&rnd=new")
 
+# After this many failed requests in a row, use the local PRNG for a while
+MAX_CONSECUTIVE_FAILURES = 3
+FALLBACK_SECONDS = 60
 
-def get_random() -> float:
+
+# Reuse one session so keep-alive saves the TCP/TLS handshake on every fight
+_session = requests.Session()
+_session.headers['Connection'] = 'keep-alive'
+
+# Each request fetches a batch of numbers (num=128), handed out one per fight
+_buffer = deque()
+_lock = threading.Lock()
+
+_consecutive_failures = 0
+_fallback_until = 0.0
+
+
+def _fetch_randoms() -> List[float]:
     try:
-        response = requests.get(RANDOM_ORG_URL, timeout=5)
+        response = _session.get(RANDOM_ORG_URL, timeout=5)
 
         # Check if the request was successful
         response.raise_for_status()
 
-        random_number_str = response.text.strip()
+        random_number_strs = response.text.split()
 
         try:
-            random_number = float(random_number_str)
+            random_numbers = [float(random_number_str) for random_number_str in random_number_strs]
         except ValueError:
-            raise ValueError(f"Invalid response from random.org: {random_number_str}")
+            random_numbers = []
 
-        return random_number
+        if not random_numbers:
+            raise ValueError(f"Invalid response from random.org: {response.text.strip()}")
+
+        return random_numbers
 
     except requests.exceptions.Timeout:
         raise RuntimeError("Request to random.org timed out.")
 
     except requests.exceptions.RequestException as e:
         raise RuntimeError(f"Request to random.org failed: {e}")
+
+
+def _fill_buffer() -> None:
+    global _consecutive_failures, _fallback_until
+
+    if not RANDOM_ORG_URL or time.monotonic() < _fallback_until:
+        _buffer.append(random.random())
+        return
+
+    try:
+        random_numbers = _fetch_randoms()
+    except RuntimeError as e:
+        _consecutive_failures += 1
+        if _consecutive_failures < MAX_CONSECUTIVE_FAILURES:
+            raise
+
+        logger.warning("%s Falling back to local random numbers for %d seconds.", e, FALLBACK_SECONDS)
+        _consecutive_failures = 0
+        _fallback_until = time.monotonic() + FALLBACK_SECONDS
+        _buffer.append(random.random())
+        return
+
+    _consecutive_failures = 0
+    _buffer.extend(random_numbers)
+
+
+def get_random() -> float:
+    with _lock:
+        if not _buffer:
+            _fill_buffer()
+
+        return _buffer.popleft()
@@ -1,10 +1,12 @@
 import logging
 import sys
 
-from flask import current_app, has_request_context
-
 
 def configure_logger(logger):
+    # A logger that already has handlers is configured; adding more would duplicate every line
+    if logger.handlers:
+        return
+
     logger.setLevel(logging.DEBUG)
 
     # Create a console handler that logs to stderr
@@ -18,10 +20,4 @@ def configure_logger(logger):
     handler.setFormatter(formatter)
 
     # Add the handler to the logger
-    logger.addHandler(handler)
-
-    # We also need to add the handler to the Flask logger
-    if has_request_context():
-        app_logger = current_app.logger
-        for handler in app_logger.handlers:
-            logger.addHandler(handler)
\ No newline at end of file
+    logger.addHandler(handler)
\ No newline at end of file
@@ -1,18 +1,58 @@
+import atexit
 from contextlib import contextmanager
 import logging
 import os
+import queue
 import sqlite3
-
-from boxing.utils.logger import configure_logger
+import threading
+import time
+from urllib.parse import quote
 
 
 logger = logging.getLogger(__name__)
-configure_logger(logger)
 
 
 # load the db path from the environment with a default value
 DB_PATH = os.getenv("DB_PATH", "/app/sql/boxing.db")
 
+# Number of read-only connections shared by the read-heavy queries
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "4"))
+
+# Seconds to wait for a pooled connection before giving up
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "5"))
+
+# Prepared statements each pooled connection keeps cached
+DB_CACHED_STATEMENTS = 256
+
+# Pragmas applied once to every pooled connection
+READ_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-64000;",
+)
+WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+) + READ_PRAGMAS
+
+
+# Indexes backing the name lookups and the leaderboard query. The partial index
+# only holds boxers who have fought, in wins order, so the wins leaderboard is
+# read straight from it without a sort.
+INDEXES = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_boxers_name ON boxers(name);",
+    "CREATE INDEX IF NOT EXISTS idx_boxers_wins ON boxers(wins DESC) WHERE fights > 0;",
+)
+
+
+def _ensure_indexes(cursor: sqlite3.Cursor) -> None:
+    # Databases created before the indexes were added to init_db.sql need them too
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='boxers';")
+    if cursor.fetchone() is None:
+        return
+
+    for index in INDEXES:
+        cursor.execute(index)
+
 
 def check_database_connection():
     try:
@@ -21,6 +61,9 @@ def check_database_connection():
 
         # Execute a simple query to verify the connection is active
         cursor.execute("SELECT 1;")
+
+        _ensure_indexes(cursor)
+        conn.commit()
         conn.close()
 
     except sqlite3.Error as e:
@@ -47,14 +90,126 @@ def check_table_exists(tablename: str):
         error_message = f"Table check error for '{tablename}': {e}"
         raise Exception(error_message) from e
 
+
+class SQLitePool:
+    """A bounded pool of SQLite connections that are opened once and reused.
+
+    Connections are opened lazily (the database may not exist yet when this
+    module is imported) until the pool holds ``size`` of them. After that,
+    callers wait up to ``timeout`` seconds for a connection to be handed back.
+
+    """
+    # While waiting, re-check this often whether a discarded connection freed a slot
+    _RECHECK_SECONDS = 0.1
+
+    def __init__(self, path: str, size: int = 4, read_only: bool = False,
+                 timeout: float = DB_POOL_TIMEOUT):
+        self.path = path
+        self.size = size
+        self.read_only = read_only
+        self.timeout = timeout
+        self._q = queue.Queue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new(self) -> sqlite3.Connection:
+        if self.read_only:
+            conn = sqlite3.connect(f"file:{quote(self.path)}?mode=ro", uri=True,
+                                   isolation_level=None, check_same_thread=False,
+                                   cached_statements=DB_CACHED_STATEMENTS)
+            pragmas = READ_PRAGMAS
+        else:
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False,
+                                   cached_statements=DB_CACHED_STATEMENTS)
+            pragmas = WRITE_PRAGMAS
+
+        for pragma in pragmas:
+            conn.execute(pragma)
+
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                return self._q.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                can_open = self._created < self.size
+                if can_open:
+                    self._created += 1
+
+            if can_open:
+                try:
+                    return self._new()
+                except sqlite3.Error:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise sqlite3.OperationalError(
+                    f"Timed out after {self.timeout} seconds waiting for a database connection."
+                )
+
+            try:
+                return self._q.get(timeout=min(remaining, self._RECHECK_SECONDS))
+            except queue.Empty:
+                continue
+
+    def put(self, conn: sqlite3.Connection) -> None:
+        # The connection will be reused, so never hand back a dangling transaction
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+
+        self._q.put(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        # Drop a broken connection and free its slot so a fresh one can be opened
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+        with self._lock:
+            self._created -= 1
+
+    def close(self) -> None:
+        while True:
+            try:
+                conn = self._q.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+
+# SQLite allows a single writer, so all writes share one connection
+_write_pool = SQLitePool(DB_PATH, size=1)
+_read_pool = SQLitePool(DB_PATH, size=DB_READ_POOL_SIZE, read_only=True)
+
+
+@atexit.register
+def close_db_connections():
+    _write_pool.close()
+    _read_pool.close()
+
+
 @contextmanager
-def get_db_connection():
-    conn = None
+def get_db_connection(read_only: bool = False):
+    pool = _read_pool if read_only else _write_pool
+    conn = pool.get()
     try:
-        conn = sqlite3.connect(DB_PATH)
         yield conn
     except sqlite3.Error as e:
         raise e
     finally:
-        if conn:
-            conn.close()
+        pool.put(conn)
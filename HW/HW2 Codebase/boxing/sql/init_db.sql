@@ -11,3 +11,4 @@ CREATE TABLE boxers (
 );
 
 CREATE UNIQUE INDEX idx_boxers_name ON boxers(name);
+CREATE INDEX idx_boxers_wins ON boxers(wins DESC) WHERE fights > 0;
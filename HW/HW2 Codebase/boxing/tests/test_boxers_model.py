@@ -0,0 +1,291 @@
+from contextlib import contextmanager
+from pathlib import Path
+import re
+import sqlite3
+
+import pytest
+
+from boxing.models import boxers_model
+from boxing.models.boxers_model import (
+    create_boxers_bulk,
+    delete_boxer,
+    get_boxer_by_id,
+    get_boxer_by_name,
+    get_leaderboard,
+    get_weight_class,
+    update_boxer_stats
+)
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+INIT_DB_SQL = (Path(__file__).parent.parent / "sql" / "init_db.sql").read_text()
+
+BOXER_ROW = (1, "Test Boxer", 160, 70, 72.0, 25)
+LEADERBOARD_ROW = {
+    'id': 1, 'name': "Test Boxer", 'weight': 160, 'height': 70, 'reach': 72.0, 'age': 25,
+    'weight_class': 'LIGHTWEIGHT', 'fights': 2, 'wins': 1, 'win_pct': 0.5
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty module-level caches."""
+    boxers_model._invalidate_boxer_cache()
+    boxers_model._invalidate_leaderboard_cache()
+    yield
+    boxers_model._invalidate_boxer_cache()
+    boxers_model._invalidate_leaderboard_cache()
+
+
+# Mocking the database connection for tests
+@pytest.fixture
+def mock_cursor(mocker):
+    mock_conn = mocker.Mock()
+    mock_cursor = mocker.MagicMock()  # MagicMock so the leaderboard can iterate it
+
+    # Mock the connection's cursor
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.fetchone.return_value = None  # Default return for queries
+    mock_cursor.rowcount = 1
+
+    # Mock the get_db_connection context manager from sql_utils
+    @contextmanager
+    def mock_get_db_connection(read_only=False):
+        yield mock_conn  # Yield the mocked connection object
+
+    mocker.patch("boxing.models.boxers_model.get_db_connection", mock_get_db_connection)
+
+    return mock_cursor  # Return the mock cursor so we can set expectations per test
+
+
+# A real in-memory database built from init_db.sql, for tests that depend on SQLite itself
+@pytest.fixture
+def sqlite_db(mocker):
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.executescript(INIT_DB_SQL)
+
+    @contextmanager
+    def mock_get_db_connection(read_only=False):
+        yield conn
+
+    mocker.patch("boxing.models.boxers_model.get_db_connection", mock_get_db_connection)
+
+    yield conn
+    conn.close()
+
+
+######################################################
+#
+#    Bulk create
+#
+######################################################
+
+
+def test_create_boxers_bulk_skips_existing_names(sqlite_db):
+    """Test that a bulk insert skips a duplicate name and returns only the rows it inserted.
+
+    """
+    sqlite_db.execute("INSERT INTO boxers (name, weight, height, reach, age) VALUES ('Existing', 150, 70, 70.0, 25)")
+
+    inserted = create_boxers_bulk([
+        ("Existing", 160, 71, 71.0, 26),
+        ("New One", 170, 72, 72.0, 27),
+        ("New Two", 180, 73, 73.0, 28),
+    ])
+
+    assert inserted == 2
+    assert sqlite_db.execute("SELECT weight FROM boxers WHERE name = 'Existing'").fetchone()[0] == 150
+    assert sqlite_db.execute("SELECT COUNT(*) FROM boxers").fetchone()[0] == 3
+
+
+@pytest.mark.parametrize("invalid_row, message", [
+    ((None, 170, 72, 72.0, 27), "Invalid name: None. Must be a non-empty string."),
+    (("", 170, 72, 72.0, 27), "Invalid name: ''. Must be a non-empty string."),
+    (("Too Light", 100, 72, 72.0, 27), "Invalid weight: 100. Must be at least 125."),
+])
+def test_create_boxers_bulk_invalid_row_writes_nothing(sqlite_db, invalid_row, message):
+    """Test that one invalid row raises and leaves the table untouched.
+
+    """
+    with pytest.raises(ValueError, match=re.escape(message)):
+        create_boxers_bulk([("Valid Boxer", 160, 71, 71.0, 26), invalid_row])
+
+    assert sqlite_db.execute("SELECT COUNT(*) FROM boxers").fetchone()[0] == 0
+    assert sqlite_db.execute("SELECT seq FROM sqlite_sequence WHERE name = 'boxers'").fetchone() is None
+
+
+def test_create_boxers_bulk_empty(sqlite_db):
+    """Test that an empty bulk insert returns 0.
+
+    """
+    assert create_boxers_bulk([]) == 0
+
+
+######################################################
+#
+#    Lookup caching
+#
+######################################################
+
+
+def test_get_boxer_by_id_is_cached(mock_cursor):
+    """Test that a second lookup of the same boxer does not query the database.
+
+    """
+    mock_cursor.fetchone.return_value = BOXER_ROW
+
+    boxer = get_boxer_by_id(1)
+
+    assert get_boxer_by_id(1) is boxer
+    assert get_boxer_by_name("Test Boxer") is boxer
+    assert mock_cursor.execute.call_count == 1, "Expected only the first lookup to hit the database."
+
+
+def test_deleted_boxer_not_returned_by_lookups(mock_cursor):
+    """Test that neither lookup returns a boxer once it has been deleted.
+
+    """
+    mock_cursor.fetchone.return_value = BOXER_ROW
+    get_boxer_by_id(1)
+    get_boxer_by_name("Test Boxer")
+
+    delete_boxer(1)
+    mock_cursor.fetchone.return_value = None
+
+    with pytest.raises(ValueError, match="Boxer with ID 1 not found."):
+        get_boxer_by_id(1)
+
+    with pytest.raises(ValueError, match="Boxer 'Test Boxer' not found."):
+        get_boxer_by_name("Test Boxer")
+
+
+def test_lookup_racing_delete_is_not_cached(mock_cursor):
+    """Test that a lookup which read the boxer before a concurrent delete does not cache it.
+
+    """
+    def read_row_then_delete():
+        # Another thread deletes the boxer after this lookup has read its row
+        delete_boxer(1)
+        return BOXER_ROW
+
+    mock_cursor.fetchone.side_effect = read_row_then_delete
+    get_boxer_by_id(1)
+
+    mock_cursor.fetchone.side_effect = None
+    mock_cursor.fetchone.return_value = None
+
+    with pytest.raises(ValueError, match="Boxer with ID 1 not found."):
+        get_boxer_by_id(1)
+
+
+######################################################
+#
+#    Leaderboard caching
+#
+######################################################
+
+
+def test_get_leaderboard_is_cached(mock_cursor):
+    """Test that the leaderboard is served from the cache until a result is recorded.
+
+    """
+    mock_cursor.__iter__.return_value = [LEADERBOARD_ROW]
+
+    leaderboard = get_leaderboard("wins")
+
+    assert leaderboard == [{**LEADERBOARD_ROW, 'win_pct': 50.0}]
+    assert get_leaderboard("wins") == leaderboard
+    assert mock_cursor.__iter__.call_count == 1, "Expected the second call to be served from the cache."
+
+    update_boxer_stats(1, "win")
+    get_leaderboard("wins")
+
+    assert mock_cursor.__iter__.call_count == 2, "Expected recording a result to invalidate the leaderboard."
+
+
+def test_get_leaderboard_returns_copies(mock_cursor):
+    """Test that editing a returned leaderboard does not change what later callers get.
+
+    """
+    mock_cursor.__iter__.return_value = [LEADERBOARD_ROW]
+
+    leaderboard = get_leaderboard("wins")
+    leaderboard[0]['wins'] = 99
+    leaderboard.clear()
+
+    cached = get_leaderboard("wins")
+    cached[0]['name'] = "Changed"
+
+    assert get_leaderboard("wins") == [{**LEADERBOARD_ROW, 'win_pct': 50.0}]
+    assert mock_cursor.__iter__.call_count == 1, "Expected the later calls to be served from the cache."
+
+
+def test_leaderboard_racing_update_is_not_cached(mock_cursor):
+    """Test that a leaderboard computed before a concurrent result was recorded is not cached.
+
+    """
+    def read_rows_then_update():
+        # Another thread records a result while this query is reading rows
+        update_boxer_stats(1, "win")
+        return iter([LEADERBOARD_ROW])
+
+    mock_cursor.__iter__.side_effect = read_rows_then_update
+    get_leaderboard("wins")
+
+    mock_cursor.__iter__.side_effect = lambda: iter([LEADERBOARD_ROW])
+    get_leaderboard("wins")
+
+    assert mock_cursor.__iter__.call_count == 2, "Expected the stale leaderboard not to be cached."
+
+
+def test_get_leaderboard_invalid_weight(mock_cursor):
+    """Test that a stored weight below the lightest class raises like get_weight_class.
+
+    """
+    mock_cursor.__iter__.return_value = [{**LEADERBOARD_ROW, 'weight': 100, 'weight_class': None}]
+
+    with pytest.raises(ValueError, match="Invalid weight: 100. Weight must be at least 125."):
+        get_leaderboard("wins")
+
+
+@pytest.mark.parametrize("weight", [125, 132.9, 133, 165, 166, 202, 203, 300])
+def test_leaderboard_weight_class_sql_matches_get_weight_class(weight):
+    """Test that the SQL CASE gives the same class as get_weight_class at every boundary.
+
+    """
+    with sqlite3.connect(":memory:") as conn:
+        sql_weight_class = conn.execute(
+            f"SELECT {boxers_model._SQL_WEIGHT_CLASS} FROM (SELECT ? AS weight)", (weight,)
+        ).fetchone()[0]
+
+    assert sql_weight_class == get_weight_class(weight)
+
+
+def test_leaderboard_weight_class_sql_below_lightest_class():
+    """Test that the SQL CASE leaves weights below the lightest class as NULL.
+
+    """
+    with sqlite3.connect(":memory:") as conn:
+        sql_weight_class = conn.execute(
+            f"SELECT {boxers_model._SQL_WEIGHT_CLASS} FROM (SELECT 124 AS weight)"
+        ).fetchone()[0]
+
+    assert sql_weight_class is None
+
+
+def test_wins_leaderboard_reads_index_without_sorting():
+    """Test that the wins leaderboard is served in index order with no separate sort step.
+
+    """
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(INIT_DB_SQL)
+        plan = " ".join(
+            row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + boxers_model._SQL_LEADERBOARD["wins"])
+        )
+
+    assert "idx_boxers_wins" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,118 @@
+import pytest
+
+from boxing.models.boxers_model import Boxer
+from boxing.models.ring_model import RingModel, fighting_skill_batch
+
+
+@pytest.fixture()
+def ring_model():
+    """Fixture to provide a new instance of RingModel for each test."""
+    return RingModel()
+
+"""Fixture providing boxers on both sides of every age modifier boundary."""
+@pytest.fixture
+def sample_boxers():
+    return [
+        Boxer(1, "Young Boxer", 150, 70, 70.0, 18),
+        Boxer(2, "Edge Young", 160, 71, 71.5, 24),
+        Boxer(3, "Prime", 170, 72, 73.0, 25),
+        Boxer(4, "Veteran Boxer", 210, 74, 76.5, 35),
+        Boxer(5, "Old", 130, 68, 69.0, 36),
+        Boxer(6, "Oldest Boxer", 205, 75, 80.0, 40),
+    ]
+
+
+##################################################
+# Fighting Skill Test Cases
+##################################################
+
+
+def test_fighting_skill_batch_matches_scalar(ring_model, sample_boxers):
+    """Test that the vectorized skill matches get_fighting_skill for every age bracket.
+
+    """
+    pytest.importorskip("numpy")
+
+    skills = fighting_skill_batch(sample_boxers)
+
+    expected = [ring_model.get_fighting_skill(boxer) for boxer in sample_boxers]
+    assert skills.tolist() == pytest.approx(expected)
+
+
+def test_fighting_skill_batch_empty():
+    """Test that an empty list of boxers gives an empty array.
+
+    """
+    pytest.importorskip("numpy")
+
+    assert fighting_skill_batch([]).shape == (0,)
+
+
+##################################################
+# Fight Test Cases
+##################################################
+
+
+@pytest.fixture
+def strong_boxer():
+    return Boxer(7, "Heavy Hitter", 220, 76, 80.0, 30)
+
+
+@pytest.fixture
+def weak_boxer():
+    return Boxer(8, "Al", 125, 65, 65.0, 30)
+
+
+@pytest.mark.parametrize("strong_first", [True, False])
+def test_fight_stronger_boxer_wins_from_either_slot(ring_model, strong_boxer, weak_boxer, strong_first):
+    """Test that the stronger boxer wins with a high random number, whichever slot it is in.
+
+    """
+    boxers = [strong_boxer, weak_boxer] if strong_first else [weak_boxer, strong_boxer]
+    for boxer in boxers:
+        ring_model.enter_ring(boxer)
+
+    winner = ring_model.fight(rng=lambda: 0.99, record_result=lambda boxer_id, result: None)
+
+    assert winner == strong_boxer.name
+
+
+def test_fight_large_skill_gap_does_not_overflow(ring_model, strong_boxer, weak_boxer):
+    """Test that a skill gap in the thousands does not raise OverflowError from either slot.
+
+    """
+    assert ring_model.get_fighting_skill(strong_boxer) - ring_model.get_fighting_skill(weak_boxer) > 1000
+
+    for boxers in ([strong_boxer, weak_boxer], [weak_boxer, strong_boxer]):
+        for boxer in boxers:
+            ring_model.enter_ring(boxer)
+
+        assert ring_model.fight(rng=lambda: 0.5, record_result=lambda boxer_id, result: None) == strong_boxer.name
+
+
+def test_fight_records_win_and_loss(ring_model, strong_boxer, weak_boxer, mocker):
+    """Test that the winner is recorded with a 'win' and the loser with a 'loss'.
+
+    """
+    record_result = mocker.Mock()
+    ring_model.enter_ring(weak_boxer)
+    ring_model.enter_ring(strong_boxer)
+
+    ring_model.fight(rng=lambda: 0.5, record_result=record_result)
+
+    assert record_result.call_args_list == [
+        mocker.call(strong_boxer.id, 'win'),
+        mocker.call(weak_boxer.id, 'loss'),
+    ]
+
+
+def test_fight_clears_ring(ring_model, strong_boxer, weak_boxer):
+    """Test that the ring is empty after a fight.
+
+    """
+    ring_model.enter_ring(strong_boxer)
+    ring_model.enter_ring(weak_boxer)
+
+    ring_model.fight(rng=lambda: 0.5, record_result=lambda boxer_id, result: None)
+
+    assert ring_model.ring == []
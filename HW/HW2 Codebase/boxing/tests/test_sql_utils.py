@@ -0,0 +1,66 @@
+import sqlite3
+
+import pytest
+
+from boxing.utils.sql_utils import SQLitePool
+
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Fixture to provide a single-connection pool over a temporary database."""
+    pool = SQLitePool(str(tmp_path / "boxing.db"), size=1, timeout=0.2)
+    yield pool
+    pool.close()
+
+
+######################################################
+#
+#    Checkout / return
+#
+######################################################
+
+
+def test_pool_reuses_connection(pool):
+    """Test that a returned connection is handed out again instead of opening a new one.
+
+    """
+    conn = pool.get()
+    pool.put(conn)
+
+    assert pool.get() is conn
+
+
+def test_pool_get_times_out_when_exhausted(pool):
+    """Test that waiting for a connection from an exhausted pool raises instead of blocking forever.
+
+    """
+    pool.get()
+
+    with pytest.raises(sqlite3.OperationalError, match="Timed out after 0.2 seconds"):
+        pool.get()
+
+
+def test_pool_put_discards_connection_when_rollback_fails(pool, mocker):
+    """Test that a connection whose rollback fails is closed and its slot freed.
+
+    """
+    broken_conn = mocker.Mock()
+    broken_conn.in_transaction = True
+    broken_conn.rollback.side_effect = sqlite3.OperationalError("disk I/O error")
+    mocker.patch.object(pool, "_new", return_value=broken_conn)
+
+    pool.put(pool.get())
+
+    broken_conn.close.assert_called_once()
+
+    # The freed slot lets the next caller open a fresh connection
+    fresh_conn = mocker.Mock()
+    pool._new.return_value = fresh_conn
+    assert pool.get() is fresh_conn